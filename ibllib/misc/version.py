@@ -1,10 +1,16 @@
+import functools
+import operator
+
 import pkg_resources
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_version_tag(v):
+    return tuple(int(x) for x in v.split('.'))
+
+
 def _compare_version_tag(v1, v2, fcn):
-    v1_ = ''.join(['{:03d}'.format(int(v)) for v in v1.split('.')])
-    v2_ = ''.join(['{:03d}'.format(int(v)) for v in v2.split('.')])
-    return fcn(v1_, v2_)
+    return fcn(_parse_version_tag(v1), _parse_version_tag(v2))
 
 
 def gt(v1, v2):
@@ -17,7 +23,7 @@ def gt(v1, v2):
     :type v2: str
     :return: bool
     """
-    return _compare_version_tag(v1, v2, str.__gt__)
+    return _compare_version_tag(v1, v2, operator.gt)
 
 
 def ge(v1, v2):
@@ -30,7 +36,7 @@ def ge(v1, v2):
     :type v2: str
     :return: bool
     """
-    return _compare_version_tag(v1, v2, str.__ge__)
+    return _compare_version_tag(v1, v2, operator.ge)
 
 
 def lt(v1, v2):
@@ -43,7 +49,7 @@ def lt(v1, v2):
     :type v2: str
     :return: bool
     """
-    return _compare_version_tag(v1, v2, str.__lt__)
+    return _compare_version_tag(v1, v2, operator.lt)
 
 
 def le(v1, v2):
@@ -56,7 +62,7 @@ def le(v1, v2):
     :type v2: str
     :return: bool
     """
-    return _compare_version_tag(v1, v2, str.__le__)
+    return _compare_version_tag(v1, v2, operator.le)
 
 
 def eq(v1, v2):
@@ -69,7 +75,7 @@ def eq(v1, v2):
     :type v2: str
     :return: bool
     """
-    return _compare_version_tag(v1, v2, str.__eq__)
+    return _compare_version_tag(v1, v2, operator.eq)
 
 
 def ibllib():